@@ -1,4 +1,4 @@
-import importlib.metadata
+from importlib.metadata import entry_points
 
 from PyInstaller.utils.hooks import collect_entry_point, copy_metadata
 from PyInstaller.utils.hooks import collect_submodules, collect_data_files
@@ -7,12 +7,20 @@ from PyInstaller.utils.hooks import collect_submodules, collect_data_files
 binaries = []
 datas, hiddenimports = collect_entry_point("kama_dbm.plugins")
 
+# Resolve plugin distributions through their entry points
+# instead of scanning metadata of every installed distribution.
+# Entry points that aren't backed by a distribution have
+# no metadata to copy, they're covered by collect_entry_point.
+plugin_distributions = {
+    entry_point.dist.name: entry_point.dist
+    for entry_point in entry_points(group="kama_dbm.plugins")
+    if entry_point.dist is not None
+}
+
 # Import modules and metadata of KamaUI plugins
 # since they're being discovered and invoked
 # dynamically.
-for dist in importlib.metadata.distributions():
-    if not any(ep.group == "kama_dbm.plugins" for ep in dist.entry_points):
-        continue
+for dist in plugin_distributions.values():
 
     # Use the actual package name (the folder name),
     # not just the metadata Name
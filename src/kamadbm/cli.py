@@ -1,14 +1,28 @@
-from importlib.metadata import entry_points
 import argparse
+import functools
 import os
 import sys
-from typing import Final
+from typing import TYPE_CHECKING, Final
 
 from kutil.meta import SingletonMeta
 
-from kamadbm.migrator import MigrateCommand
-from kamadbm.extractor import DataExtractor, RegularExtractor, ExtractCommand
-from kamadbm.importer import DataImporter, RegularImporter, ImportCommand
+if TYPE_CHECKING:
+    from kamadbm.extractor import DataExtractor
+    from kamadbm.importer import DataImporter
+
+
+@functools.cache
+def _get_plugin_entry_points():
+    """
+    Looks up entry points registered under the 'kama_dbm.plugins' group.
+    The lookup is performed only once per process.
+
+    Returns:
+        tuple[EntryPoint, ...]: Plugin entry points.
+    """
+
+    from importlib.metadata import entry_points
+    return tuple(entry_points(group="kama_dbm.plugins"))
 
 
 class DatabaseCLI(metaclass=SingletonMeta):
@@ -28,14 +42,21 @@ class DatabaseCLI(metaclass=SingletonMeta):
     Name of the regular extract type.
     """
 
+    _plugins_loaded: bool = False
+    """
+    Whether plugins have already been loaded in this process.
+    """
+
     def __init__(self):
         """
         Initializes the DatabaseCLI with empty registries for extractors,
         importers, and migration paths.
         """
 
-        self.__extractors: dict[str, DataExtractor] = {}
-        self.__importers: dict[str, DataImporter] = {}
+        self.__extractors: dict[str, "DataExtractor"] = {}
+        self.__importers: dict[str, "DataImporter"] = {}
+        self.__regular_extractor: "DataExtractor | None" = None
+        self.__regular_importer: "DataImporter | None" = None
         self.__migration_paths: list[str] = []
 
     def post_init(self):
@@ -44,6 +65,9 @@ class DatabaseCLI(metaclass=SingletonMeta):
         importing and extracting data.
         """
 
+        from kamadbm.extractor import RegularExtractor
+        from kamadbm.importer import RegularImporter
+
         self.add_importer(RegularImporter())
         self.add_extractor(RegularExtractor())
 
@@ -78,8 +102,7 @@ class DatabaseCLI(metaclass=SingletonMeta):
             DataImporter: The requested importer or the default 'Regular' importer.
         """
 
-        importer = self.__importers.get(name)
-        return importer or self.__importers.get(self.Regular)
+        return self.__importers.get(name, self.__regular_importer)
 
     def get_extractor(self, name: str):
         """
@@ -93,10 +116,9 @@ class DatabaseCLI(metaclass=SingletonMeta):
             DataExtractor: The requested extractor or the default 'Regular' extractor.
         """
 
-        extractor = self.__extractors.get(name)
-        return extractor or self.__extractors.get(self.Regular)
+        return self.__extractors.get(name, self.__regular_extractor)
 
-    def add_importer(self, importer: DataImporter):
+    def add_importer(self, importer: "DataImporter"):
         """
         Registers a new DataImporter instance.
         The name is automatically derived from the class name (stripping 'Importer').
@@ -108,7 +130,10 @@ class DatabaseCLI(metaclass=SingletonMeta):
         name = importer.__class__.__name__.replace("Importer", "")
         self.__importers[name] = importer
 
-    def add_extractor(self, extractor: DataExtractor):
+        if name == self.Regular:
+            self.__regular_importer = importer
+
+    def add_extractor(self, extractor: "DataExtractor"):
         """
         Registers a new DataExtractor instance.
         The name is automatically derived from the class name (stripping 'Extractor').
@@ -120,6 +145,9 @@ class DatabaseCLI(metaclass=SingletonMeta):
         name = extractor.__class__.__name__.replace("Extractor", "")
         self.__extractors[name] = extractor
 
+        if name == self.Regular:
+            self.__regular_extractor = extractor
+
     def run(self):
         """
         Main execution loop for the CLI tool.
@@ -142,9 +170,13 @@ class DatabaseCLI(metaclass=SingletonMeta):
             help="Select an operation to perform."
         )
 
-        self.__add_migrate_command(subparsers)
-        self.__add_import_command(subparsers)
-        self.__add_extract_command(subparsers)
+        # Only the invoked command gets its arguments configured,
+        # the rest are registered by name for the help output.
+        command = sys.argv[1] if len(sys.argv) > 1 else None
+
+        self.__add_migrate_command(subparsers, command)
+        self.__add_import_command(subparsers, command)
+        self.__add_extract_command(subparsers, command)
 
         if len(sys.argv) == 1:
             parser.print_help(sys.stderr)
@@ -159,20 +191,26 @@ class DatabaseCLI(metaclass=SingletonMeta):
             print(f"\nCritical Error during execution: {e}", file=sys.stderr)
             sys.exit(1)
 
-    def __add_migrate_command(self, subparsers):
+    def __add_migrate_command(self, subparsers, command: str):
         """
         Configures the 'migrate' subcommand and its arguments.
+        Arguments are only configured when 'migrate' is the invoked command.
 
         Args:
             subparsers: The argparse subparser object to attach to.
+            command (str): The name of the invoked command.
         """
 
-        migrate_command = MigrateCommand(self)
         migrate_parser = subparsers.add_parser(
             "migrate",
             help="Run Python-based database schema migrations."
         )
 
+        if command != "migrate":
+            return
+
+        from kamadbm.migrator import MigrateCommand
+
         migrate_parser.add_argument(
             "--migration_directories",
             required=True,
@@ -188,22 +226,28 @@ class DatabaseCLI(metaclass=SingletonMeta):
             help="Path to SQLite file or name of in-memory database."
         )
 
-        migrate_parser.set_defaults(func=migrate_command.execute)
+        migrate_parser.set_defaults(func=lambda args: MigrateCommand(self).execute(args))
 
-    def __add_import_command(self, subparsers):
+    def __add_import_command(self, subparsers, command: str):
         """
         Configures the 'import' subcommand and its arguments.
+        Arguments are only configured when 'import' is the invoked command.
 
         Args:
             subparsers: The argparse subparser object to attach to.
+            command (str): The name of the invoked command.
         """
 
-        import_command = ImportCommand(self)
         import_parser = subparsers.add_parser(
             "import",
             help="Import table data from JSON definitions in source files."
         )
 
+        if command != "import":
+            return
+
+        from kamadbm.importer import ImportCommand
+
         import_parser.add_argument(
             "--database",
             required=True,
@@ -223,22 +267,28 @@ class DatabaseCLI(metaclass=SingletonMeta):
             help="Name of the file containing names of table definitions that needs to be imported."
         )
 
-        import_parser.set_defaults(func=import_command.execute)
+        import_parser.set_defaults(func=lambda args: ImportCommand(self).execute(args))
 
-    def __add_extract_command(self, subparsers):
+    def __add_extract_command(self, subparsers, command: str):
         """
         Configures the 'extract' subcommand and its arguments.
+        Arguments are only configured when 'extract' is the invoked command.
 
         Args:
             subparsers: The argparse subparser object to attach to.
+            command (str): The name of the invoked command.
         """
 
-        extract_command = ExtractCommand(self)
         extract_parser = subparsers.add_parser(
             "extract",
             help="Extract table data from database tables into JSON definitions."
         )
 
+        if command != "extract":
+            return
+
+        from kamadbm.extractor import ExtractCommand
+
         extract_parser.add_argument(
             "--database",
             required=True,
@@ -267,6 +317,14 @@ class DatabaseCLI(metaclass=SingletonMeta):
             help="Set filter that would limit extracted dataset."
         )
 
+        extract_parser.add_argument(
+            "--filter_params",
+            nargs="+",
+            default=[],
+            type=str,
+            help="Set values bound to '?' placeholders of the filter."
+        )
+
         extract_parser.add_argument(
             '--output',
             default=os.path.join("output", "extract"),
@@ -274,14 +332,30 @@ class DatabaseCLI(metaclass=SingletonMeta):
             help='Output directory where extracted data would be placed.'
         )
 
-        extract_parser.set_defaults(func=extract_command.execute)
+        extract_parser.set_defaults(func=lambda args: ExtractCommand(self).execute(args))
 
-    @staticmethod
-    def __discover_plugins():
+    @classmethod
+    def _clear_plugin_cache(cls):
+        """
+        Forgets looked up plugin entry points and loaded state,
+        so plugins are discovered again on the next run.
+        """
+
+        _get_plugin_entry_points.cache_clear()
+        cls._plugins_loaded = False
+
+    @classmethod
+    def __discover_plugins(cls):
         """
         Uses importlib.metadata to find and load external plugins registered
         under the 'kama_dbm.plugins' entry point group.
+        Plugins are loaded only once, subsequent calls are no-op.
         """
 
-        for plugin in entry_points(group="kama_dbm.plugins"):
+        if cls._plugins_loaded:
+            return
+
+        for plugin in _get_plugin_entry_points():
             plugin.load()
+
+        cls._plugins_loaded = True
@@ -13,7 +13,7 @@ if TYPE_CHECKING:
 _logger = get_logger(__name__)
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class CommandContext:
     """
     Data container that holds the necessary state for executing a CLI command.
@@ -1,6 +1,5 @@
 import os
 from datetime import datetime
-from pathlib import Path
 from typing import Any
 
 from kutil.file import save_file
@@ -81,7 +80,8 @@ class RegularExtractor(DataExtractor):
 
         Args:
             context (CommandContext): The context containing database
-                connections and CLI arguments like table_name, filter, and output.
+                connections and CLI arguments like table_name, filter,
+                filter_params, and output.
         """
 
         args = context.args
@@ -97,11 +97,12 @@ class RegularExtractor(DataExtractor):
 
         if args.filter:
             _logger.info("Filter: %s", args.filter)
-            table.where(args.filter)
+            _logger.info("Filter Params: %s", args.filter_params)
+            table.where(args.filter, *args.filter_params)
 
         table_data = [row.to_json(include_nulls=False) for row in table.retrieve()]
-        extract_file_path = Path(str(os.path.join(args.output, JSON.add_extension(table_name))))
-        extract_file_path.parent.mkdir(parents=True, exist_ok=True)
+        extract_file_path = os.path.join(args.output, JSON.add_extension(table_name))
+        os.makedirs(args.output or os.curdir, exist_ok=True)
 
         content = {
             "metadata": {
@@ -115,7 +116,10 @@ class RegularExtractor(DataExtractor):
         if args.filter:
             content["metadata"]["filter"] = args.filter
 
-        save_file(str(extract_file_path), content, as_json=True)
+            if args.filter_params:
+                content["metadata"]["filter_params"] = args.filter_params
+
+        save_file(extract_file_path, content, as_json=True)
 
     def _post_extract(self, data: Any, context: CommandContext):
         """
@@ -1,5 +1,6 @@
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -42,20 +43,30 @@ class ImportCommand(CLICommand):
 
         definition_file_dir = Path(args.definition_file).parent
         definition_file: str = read_file(args.definition_file)
+        import_entries = []
         files_to_import = []
 
         _logger.info("Importing definition file: %s", args.definition_file)
 
+        # Definition files use '/' as separator.
+        normalize_separators = os.path.sep != "/"
+
         # Handle definition_file argument.
-        for line in definition_file.split("\n"):
-            line = line.strip().replace("/", os.path.sep)
+        for line in definition_file.splitlines():
+            line = line.strip()
 
             # Allow comments and skip empty lines.
             if line.startswith("#") or len(line) == 0:
                 continue
 
-            file_path = os.path.join(definition_file_dir, line)
-            actual_checksum = file_checksum(file_path)
+            if normalize_separators:
+                line = line.replace("/", os.path.sep)
+
+            import_entries.append((line, os.path.join(definition_file_dir, line)))
+
+        checksums = self.__calculate_checksums([file_path for _, file_path in import_entries])
+
+        for (line, file_path), actual_checksum in zip(import_entries, checksums):
             metadata = db.table("import_data_version") \
                 .where("file_name = ?", line) \
                 .retrieve()
@@ -70,20 +81,43 @@ class ImportCommand(CLICommand):
             # Only import data if checksum has changed.
             if current_checksum != actual_checksum:
                 metadata.set_first("checksum", actual_checksum)
+                metadata.save()
                 files_to_import.append(file_path)
             else:
                 _logger.info("Import file hasn't been changed. Skipping.")
 
-            metadata.save()
-
         # Import files separately.
         for file_path in files_to_import:
             self.__invoke_importer_for_file(file_path, context)
 
+    @staticmethod
+    def __calculate_checksums(file_paths: list[str]) -> list[str]:
+        """
+        Calculates checksums of the provided files.
+
+        Files are hashed concurrently since hashing is
+        dominated by file reads. Database interaction is
+        left to the caller so the connection stays on one thread.
+
+        Args:
+            file_paths: Paths of the files to hash.
+
+        Returns:
+            Checksums in the same order as the provided paths.
+        """
+
+        if not file_paths:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(8, len(file_paths))) as executor:
+            return list(executor.map(file_checksum, file_paths))
+
     @classmethod
     def __invoke_importer_for_file(cls, file_path: str, context: CommandContext):
         """
         Reads the target file and delegates the import task to the appropriate DataImporter.
+        The parsed file is passed along as `import_file`, together with the `import_file_path`
+        it was read from, so importers don't need to read it again.
 
         Args:
             file_path: Absolute or relative path to the JSON data file.
@@ -95,6 +129,8 @@ class ImportCommand(CLICommand):
         importer = context.cli.get_importer(import_type)
 
         context.args.file_path = file_path
+        context.args.import_file = import_file
+        context.args.import_file_path = file_path
         importer.do_import(context)
 
 
@@ -130,7 +166,8 @@ class RegularImporter(DataImporter):
         Imports data from a JSON file into the specified database table.
 
         The method expects a JSON structure containing 'metadata' (table_name, type)
-        and 'data' (list of dictionaries).
+        and 'data' (list of dictionaries). Uses the already parsed `import_file`
+        argument when it was read from `file_path`, otherwise reads `file_path`.
 
         Args:
             context: The command execution context.
@@ -147,10 +184,19 @@ class RegularImporter(DataImporter):
             print("Argument '--file_path' is required for import.")
             sys.exit(1)
 
-        import_file = read_file(args.file_path, as_json=True)
+        import_file = None
+
+        # Only reuse parsed content that belongs to the requested file.
+        if getattr(args, "import_file_path", None) == args.file_path:
+            import_file = getattr(args, "import_file", None)
+
+        if import_file is None:
+            import_file = read_file(args.file_path, as_json=True)
+
         metadata = import_file.get("metadata", {})
         table_name = metadata.get("table_name")
         filter_string = metadata.get("filter")
+        filter_params = metadata.get("filter_params", [])
         data: list[dict] = import_file.get("data", [])
         data = self._format_data(data, metadata, context)
 
@@ -162,7 +208,8 @@ class RegularImporter(DataImporter):
 
         if filter_string:
             _logger.info("Filter: %s", filter_string)
-            import_table.where(filter_string)
+            _logger.info("Filter Params: %s", filter_params)
+            import_table.where(filter_string, *filter_params)
 
         _logger.info("-----------------")
 
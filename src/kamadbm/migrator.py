@@ -1,6 +1,5 @@
 import datetime
 import os
-from pathlib import Path
 
 from kdb.manager import DatabaseManager
 from kutil.file import read_file, remove_extension_from_path
@@ -73,7 +72,9 @@ class MigrateCommand(CLICommand):
 
         * **Collection:** Gathers all .sql files from migration directories.
         * **Sorting:** Orders migrations by basename to ensure correct sequence.
-        * **Validation:** Skips files that have already been applied.
+        * **Validation:** Skips files that have already been applied, based on
+          a single lookup of the schema_version table. Migrations are matched
+          by file name without extension, the way they're stored.
         * **Tracking:** Updates the schema_version table after each successful run.
 
         Args:
@@ -85,22 +86,23 @@ class MigrateCommand(CLICommand):
         migrations = []
 
         for directory in migration_directories:
-            for migration_file_name in os.listdir(directory):
-                if migration_file_name.endswith(".sql"):
-                    migrations.append(os.path.join(directory, migration_file_name))
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".sql") and entry.is_file():
+                        migrations.append((entry.path, entry.name))
 
-        migrations.sort(key=os.path.basename)
-        last_migration_name = migrations[-1]
+        migrations.sort(key=lambda migration: migration[1])
+        date_applied = datetime.datetime.now().isoformat(" ")
+        applied_migrations = cls.__get_applied_migrations(db)
+        _, last_migration_name = migrations[-1]
 
         _logger.info("Latest observed migration: %s.", last_migration_name)
-        if cls.__migration_exists(db, last_migration_name):
+        if remove_extension_from_path(last_migration_name) in applied_migrations:
             _logger.info("No migrations to perform. Exiting.")
             return
 
-        for file_path in migrations:
-            file_name = Path(file_path).name
-
-            if cls.__migration_exists(db, file_name):
+        for file_path, file_name in migrations:
+            if remove_extension_from_path(file_name) in applied_migrations:
                 _logger.info("Migration %s has already been executed. Skipping.", file_name)
                 continue
 
@@ -108,28 +110,28 @@ class MigrateCommand(CLICommand):
             script = read_file(file_path)
             db.connection().executescript(script)
 
-            cls.__update_schema_version(db, file_name)
+            cls.__update_schema_version(db, file_name, date_applied)
 
         _logger.info("All migrations have been executed.")
 
     @classmethod
-    def __migration_exists(cls, manager: DatabaseManager, migration_name: str):
+    def __get_applied_migrations(cls, manager: DatabaseManager):
         """
-        Used to check whether migration with provided name already exists.
+        Used to retrieve names of all migrations that have already been applied.
 
         Args:
             manager: The database manager to query.
-            migration_name: The name of the file to check.
 
         Returns:
-            bool: True if the migration is found in the schema_version table.
+            set[str]: Migration file names without extension,
+                as stored in the schema_version table.
         """
 
-        cursor = manager.select("SELECT 1 FROM schema_version WHERE file_name = ?", (migration_name,))
-        return cursor.fetchone() is not None
+        cursor = manager.select("SELECT file_name FROM schema_version")
+        return {row[0] for row in cursor.fetchall()}
 
     @classmethod
-    def __update_schema_version(cls, manager: DatabaseManager, migration_name: str):
+    def __update_schema_version(cls, manager: DatabaseManager, migration_name: str, date_applied: str):
         """
         Used to add migration to schema_version table.
 
@@ -142,6 +144,7 @@ class MigrateCommand(CLICommand):
         Args:
             manager: The database manager to update.
             migration_name: The filename of the migration.
+            date_applied: Timestamp of the migration run the migration was applied in.
 
         Raises:
             RuntimeError: If the migration filename format is invalid.
@@ -161,6 +164,6 @@ class MigrateCommand(CLICommand):
             file_name=migration_name,
             version=version,
             description=description,
-            date_applied=datetime.datetime.now(),
+            date_applied=date_applied,
             success=1
         ).save()
@@ -23,15 +23,11 @@ class TestKamaDBMHook:
     @pytest.fixture
     def mock_distribution(self, mocker: MockerFixture):
         """
-        Creates a mock distribution with specific entry points and metadata.
+        Creates a mock distribution with specific metadata.
         """
 
         distribution = mocker.MagicMock()
-        # Mock entry point group matching
-
-        entry_point = mocker.MagicMock()
-        entry_point.group = "kama_dbm.plugins"
-        distribution.entry_points = [entry_point]
+        distribution.name = "kama-plugin-example"
 
         # Mock metadata and package names
         distribution.metadata = {"Name": "kama-plugin-example"}
@@ -39,12 +35,24 @@ class TestKamaDBMHook:
 
         return distribution
 
-    def test_plugin_discovery_and_collection(self, mocker: MockerFixture, mock_distribution, _load_module):
+    @pytest.fixture
+    def mock_entry_point(self, mocker: MockerFixture, mock_distribution):
+        """
+        Creates a mock plugin entry point owned by the mock distribution.
+        """
+
+        entry_point = mocker.MagicMock()
+        entry_point.group = "kama_dbm.plugins"
+        entry_point.dist = mock_distribution
+
+        return entry_point
+
+    def test_plugin_discovery_and_collection(self, mocker: MockerFixture, mock_entry_point, _load_module):
         """
         Tests that the hook finds plugins and adds their modules/data.
         """
 
-        mocker.patch("importlib.metadata.distributions", return_value=[mock_distribution])
+        entry_points_mock = mocker.patch("importlib.metadata.entry_points", return_value=[mock_entry_point])
         mocker.patch("PyInstaller.utils.hooks.collect_entry_point", return_value=([], ["initial_import"]))
         mocker.patch("PyInstaller.utils.hooks.collect_submodules", return_value=["kama_plugin_pkg.sub"])
         mocker.patch("PyInstaller.utils.hooks.collect_data_files", return_value=[("data_src", "data_dst")])
@@ -60,6 +68,24 @@ class TestKamaDBMHook:
         assert ("meta_src", "meta_dst") in hook_module.datas
 
         copy_metadata_mock.assert_called_with("kama-plugin-example")
+        entry_points_mock.assert_called_once_with(group="kama_dbm.plugins")
+
+    def test_entry_point_without_distribution_is_skipped(self, mocker: MockerFixture, mock_entry_point,
+                                                        _load_module):
+        """
+        Ensures entry points that aren't backed by a distribution don't break collection.
+        """
+
+        mock_entry_point.dist = None
+
+        mocker.patch("importlib.metadata.entry_points", return_value=[mock_entry_point])
+        mocker.patch("PyInstaller.utils.hooks.collect_entry_point", return_value=([], ["initial_import"]))
+        copy_metadata_mock = mocker.patch("PyInstaller.utils.hooks.copy_metadata")
+
+        hook_module = _load_module()
+
+        assert hook_module.hiddenimports == ["initial_import"]
+        copy_metadata_mock.assert_not_called()
 
     def test_binary_only_added_if_exists(self, mocker: MockerFixture, _load_module):
         """
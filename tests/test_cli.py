@@ -1,6 +1,17 @@
 import pytest
 from pytest_mock import MockerFixture
 
+from kamadbm.cli import DatabaseCLI
+from kamadbm.extractor import DataExtractor, RegularExtractor
+from kamadbm.importer import DataImporter, RegularImporter
+
+
+def _argument_calls(add_argument_mock):
+    """
+    Maps names of configured arguments to their add_argument calls.
+    """
+    return {call_obj.args[0]: call_obj for call_obj in add_argument_mock.call_args_list}
+
 
 class TestDatabaseCLI:
 
@@ -14,24 +25,31 @@ class TestDatabaseCLI:
         return module_patch("sys.exit")
 
     @pytest.fixture
-    def migrate_command_mock(self, module_patch):
-        return module_patch("MigrateCommand").return_value
+    def migrate_command_mock(self, mocker: MockerFixture):
+        return mocker.patch("kamadbm.migrator.MigrateCommand").return_value
 
     @pytest.fixture
-    def import_command_mock(self, module_patch):
-        return module_patch("ImportCommand").return_value
+    def import_command_mock(self, mocker: MockerFixture):
+        return mocker.patch("kamadbm.importer.ImportCommand").return_value
 
     @pytest.fixture
-    def extract_command_mock(self, module_patch):
-        return module_patch("ExtractCommand").return_value
+    def extract_command_mock(self, mocker: MockerFixture):
+        return mocker.patch("kamadbm.extractor.ExtractCommand").return_value
 
     @pytest.fixture
     def _parser_mock(self, module_patch):
         return module_patch('argparse.ArgumentParser')
 
+    @pytest.fixture
+    def _subparsers_mock(self, _parser_mock):
+        return _parser_mock.return_value.add_subparsers.return_value
+
+    @pytest.fixture
+    def _add_argument_mock(self, _subparsers_mock):
+        return _subparsers_mock.add_parser.return_value.add_argument
+
     @pytest.fixture
     def _cli(self):
-        from kamadbm.cli import DatabaseCLI
         return DatabaseCLI()
 
     @pytest.fixture
@@ -84,7 +102,6 @@ class TestDatabaseCLI:
         Verify 'extract' command calls invoke_extractor with correct defaults.
         """
 
-        from kamadbm.cli import DatabaseCLI
         run_main_with_args([
             'extract', '--table_name', 'config_data',
             "--database", "/path/to/db"
@@ -100,20 +117,14 @@ class TestDatabaseCLI:
         assert called_args.output.startswith('output')  # Checks the default path
 
 
-    def test_extract_command_choices_are_correctly_built(self, _parser_mock, _cli, run_main_with_args):
+    def test_extract_command_choices_are_correctly_built(self, _add_argument_mock, _cli, run_main_with_args):
         """
         Verify the 'type' choices include 'regular' plus discovered extractors.
         """
 
-        from kamadbm.cli import DatabaseCLI
-        from kamadbm.extractor import DataExtractor
-
         class TableExtractor(DataExtractor): pass
         class TreeExtractor(DataExtractor): pass
 
-        subparsers_mock = _parser_mock.return_value.add_subparsers.return_value
-        add_argument_mock = subparsers_mock.add_parser.return_value.add_argument
-
         _cli.add_extractor(TableExtractor())
         _cli.add_extractor(TreeExtractor())
 
@@ -123,16 +134,27 @@ class TestDatabaseCLI:
         ])
 
         # Find the call that configured the '--type' argument
-        type_arg_call = None
-        for call_obj in add_argument_mock.call_args_list:
-            if call_obj.args[0] == '--type':
-                type_arg_call = call_obj
-                break
+        type_arg_call = _argument_calls(_add_argument_mock).get('--type')
 
         assert type_arg_call is not None
         assert type_arg_call.kwargs['choices'] == [DatabaseCLI.Regular, "Table", "Tree"]
 
 
+    def test_only_invoked_command_arguments_are_built(self, _subparsers_mock, _add_argument_mock, run_main_with_args):
+        """
+        Verify that arguments are configured only for the invoked command.
+        """
+
+        run_main_with_args(['migrate', '--migration_directories', 'migrations', '--database', '/path/to/db'])
+
+        parser_names = [call_obj.args[0] for call_obj in _subparsers_mock.add_parser.call_args_list]
+        argument_names = _argument_calls(_add_argument_mock)
+
+        assert parser_names == ['migrate', 'import', 'extract']
+        assert '--migration_directories' in argument_names
+        assert '--table_name' not in argument_names
+        assert '--definition_file' not in argument_names
+
     def test_main_exits_on_no_args(self, run_main_with_args, sys_exit_mock, _parser_mock):
         """
         Verify main() exits and prints help if no arguments are provided.
@@ -145,7 +167,7 @@ class TestDatabaseCLI:
         sys_exit_mock.assert_called()
 
 
-    def test_main_handles_exception_and_exits(self, run_main_with_args, module_patch, sys_exit_mock, _parser_mock):
+    def test_main_handles_exception_and_exits(self, run_main_with_args, capsys, sys_exit_mock, _parser_mock):
         """
         Verifies that when a command raises an exception, the script prints
         an error to stderr and exits with status 1.
@@ -153,20 +175,11 @@ class TestDatabaseCLI:
 
         args_mock = _parser_mock.return_value.parse_args.return_value
         args_mock.func.side_effect = [Exception]
-        mock_stderr = module_patch("sys.stderr")
 
         run_main_with_args(['migrate'])
 
-        # Check if anything was written to stderr
-        mock_stderr.write.assert_called()
-
-        # Capture the output written to stderr
-        # The last call to write() should contain the critical error message
-        output_call = mock_stderr.write.call_args_list[0]
-        output_string = output_call.args[0]
-
         # Verify the specific format and content of the error message
-        assert "Critical Error during execution" in output_string
+        assert "Critical Error during execution" in capsys.readouterr().err
         sys_exit_mock.assert_called_once()
 
     def test_add_migration_path(self, _cli):
@@ -183,9 +196,6 @@ class TestDatabaseCLI:
 
     def test_add_importer_extractor(self, _cli):
 
-        from kamadbm.importer import DataImporter, RegularImporter
-        from kamadbm.extractor import DataExtractor, RegularExtractor
-
         class TestImporter(DataImporter): pass
         class TestExtractor(DataExtractor): pass
 
@@ -200,12 +210,18 @@ class TestDatabaseCLI:
         assert isinstance(_cli.get_extractor("Test"), TestExtractor)
         assert isinstance(_cli.get_importer("Test"), TestImporter)
 
-    def test_plugin_discovery(self, mocker: MockerFixture, module_patch, _cli):
+    @pytest.fixture
+    def _reset_plugins(self):
+        DatabaseCLI._clear_plugin_cache()
+        yield
+        DatabaseCLI._clear_plugin_cache()
+
+    def test_plugin_discovery(self, mocker: MockerFixture, _reset_plugins, _cli):
 
         first_plugin = mocker.MagicMock()
         second_plugin = mocker.MagicMock()
 
-        entry_points_mock = module_patch("entry_points")
+        entry_points_mock = mocker.patch("importlib.metadata.entry_points")
         entry_points_mock.return_value = [first_plugin, second_plugin]
 
         _cli.run()
@@ -213,3 +229,16 @@ class TestDatabaseCLI:
         entry_points_mock.assert_called_once_with(group="kama_dbm.plugins")
         first_plugin.load.assert_called_once()
         second_plugin.load.assert_called_once()
+
+    def test_plugins_are_loaded_once(self, mocker: MockerFixture, _reset_plugins, _cli):
+
+        plugin = mocker.MagicMock()
+
+        entry_points_mock = mocker.patch("importlib.metadata.entry_points")
+        entry_points_mock.return_value = [plugin]
+
+        _cli.run()
+        _cli.run()
+
+        entry_points_mock.assert_called_once_with(group="kama_dbm.plugins")
+        plugin.load.assert_called_once()
@@ -9,7 +9,9 @@ class TestCLICommand:
         """
         Provides a mocked DatabaseCLI instance.
         """
-        return mocker.MagicMock()
+
+        from kamadbm.cli import DatabaseCLI
+        return mocker.MagicMock(spec_set=DatabaseCLI)
 
     @pytest.fixture
     def _execute_command_mock(self, mocker: MockerFixture):
@@ -32,7 +34,7 @@ class TestCLICommand:
 
     @pytest.fixture
     def _args(self, mocker: MockerFixture):
-        args_mock = mocker.MagicMock()
+        args_mock = mocker.MagicMock(spec_set=["database"])
         args_mock.database = "/path/to/db.sqlite"
 
         return args_mock
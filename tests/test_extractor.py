@@ -1,17 +1,35 @@
 import datetime
+import os
+from types import SimpleNamespace
 
 import pytest
 from pytest_mock import MockerFixture
 
+from kamadbm.cli import DatabaseCLI
+from kamadbm.command import CommandContext
+from kamadbm.extractor import ExtractCommand, RegularExtractor
+
 from command import BaseCommandTest
 
 
+class MockCustomExtractor(RegularExtractor):
+    """
+    A mock custom extractor used for testing dynamic loading.
+    """
+
+    def do_extract(self, args):
+        # Simply record that this was called
+        self.extracted_data = True
+
+    def __init__(self):
+        super().__init__()
+        self.extracted_data = False
+
+
 class TestExtractCommand(BaseCommandTest):
 
     def test_extract_command_execute(self, _context):
 
-        from kamadbm.extractor import ExtractCommand
-
         extractor = _context.cli.get_extractor.return_value
 
         command = ExtractCommand(_context.cli)
@@ -34,26 +52,11 @@ class TestRegularExtractor:
         datetime_mock.now.return_value = _datetime_now
 
     @pytest.fixture
-    def path_mock(self, module_patch):
-        return module_patch("Path")
+    def makedirs_mock(self, module_patch):
+        return module_patch("os.makedirs")
 
     @pytest.fixture
     def _custom_extractor_mock(self):
-        from kamadbm.extractor import RegularExtractor
-
-        class MockCustomExtractor(RegularExtractor):
-            """
-            A mock custom extractor used for testing dynamic loading.
-            """
-
-            def do_extract(self, args):
-                # Simply record that this was called
-                self.extracted_data = True
-
-            def __init__(self):
-                super().__init__()
-                self.extracted_data = False
-
         return MockCustomExtractor
 
     @pytest.fixture
@@ -61,19 +64,18 @@ class TestRegularExtractor:
         return mocker.MagicMock()
 
     @pytest.fixture
-    def _context(self, mocker: MockerFixture, db_manager_mock, _cli):
+    def _context(self, db_manager_mock, _cli):
         """
         Fixture to provide a mock argparse Namespace object.
         """
 
-        from kamadbm.cli import DatabaseCLI
-        from kamadbm.command import CommandContext
-
-        args = mocker.MagicMock()
-        args.type = DatabaseCLI.Regular
-        args.table_name = "test_table"
-        args.output = "test_output_dir"
-        args.filter = None
+        args = SimpleNamespace(
+            type=DatabaseCLI.Regular,
+            table_name="test_table",
+            output="test_output_dir",
+            filter=None,
+            filter_params=[]
+        )
 
         return CommandContext(
             args=args,
@@ -81,36 +83,30 @@ class TestRegularExtractor:
             cli=_cli
         )
 
-    @pytest.fixture
-    def _datetime_now(self):
-        return datetime.datetime(2025, 11, 27, 10, 0, 0)
-
-    def test_regular_extractor_calls_db_and_saves_file(self, _context, save_file_mock, _datetime_now, db_manager_mock,
-                                                       db_table_mock, path_mock):
+    @pytest.fixture(scope="module")
+    def _sample_rows(self):
         """
-        Tests the main success path of do_extract without filtering.
+        Table rows shared by extraction tests, the extractor only reads them.
         """
 
-        from kamadbm.extractor import RegularExtractor
         from kdb.table import DatabaseRow
 
-        db_table_mock.retrieve.return_value = [
+        return [
             DatabaseRow("TEST_TABLE", 1, (1, "Alice", None), ["id", "name", "value"]),
             DatabaseRow("TEST_TABLE", 1, (2, "Bob", 42), ["id", "name", "value"]),
         ]
 
-        extractor = RegularExtractor()
-        extractor.do_extract(_context)
-
-        # 1. DB interaction check
-        db_manager_mock.return_value.table.assert_called_once_with("test_table")
-        db_table_mock.retrieve.assert_called_once()
-        db_table_mock.where.assert_not_called()
+    @pytest.fixture(scope="module")
+    def _datetime_now(self):
+        return datetime.datetime(2025, 11, 27, 10, 0, 0)
 
-        # 2. File system checks
-        path_mock.return_value.parent.mkdir.assert_called_once_with(parents=True, exist_ok=True)
+    @pytest.fixture(scope="module")
+    def _expected_extract_content(self, _datetime_now):
+        """
+        Extract file content expected for the sample rows without filtering.
+        """
 
-        expected_content = {
+        return {
             "metadata": {
                 "table_name": "test_table",
                 "type": "Regular",
@@ -122,18 +118,48 @@ class TestRegularExtractor:
             ]
         }
 
+    def test_regular_extractor_calls_db_and_saves_file(self, _context, save_file_mock, db_manager_mock, db_table_mock,
+                                                       makedirs_mock, _sample_rows, _expected_extract_content):
+        """
+        Tests the main success path of do_extract without filtering.
+        """
+
+        db_table_mock.retrieve.return_value = _sample_rows
+
+        extractor = RegularExtractor()
+        extractor.do_extract(_context)
+
+        # 1. DB interaction check
+        db_manager_mock.return_value.table.assert_called_once_with("test_table")
+        db_table_mock.retrieve.assert_called_once()
+        db_table_mock.where.assert_not_called()
+
+        # 2. File system checks
+        makedirs_mock.assert_called_once_with("test_output_dir", exist_ok=True)
+
         save_file_mock.assert_called_once_with(
-            str(path_mock.return_value),
-            expected_content,
+            "/mock/root/test_output_dir/test_table.json",
+            _expected_extract_content,
             as_json=True
         )
 
-    def test_regular_extractor_applies_filter(self, _context, save_file_mock, path_mock):
+    def test_regular_extractor_empty_output_uses_current_directory(self, _context, save_file_mock, makedirs_mock):
         """
-        Tests that a filter argument correctly invokes table.where() and adds filter to metadata.
+        Tests that an empty output directory falls back to the current directory.
         """
 
-        from kamadbm.extractor import RegularExtractor
+        _context.args.output = ""
+
+        extractor = RegularExtractor()
+        extractor.do_extract(_context)
+
+        makedirs_mock.assert_called_once_with(os.curdir, exist_ok=True)
+        save_file_mock.assert_called_once()
+
+    def test_regular_extractor_applies_filter(self, _context, save_file_mock, makedirs_mock):
+        """
+        Tests that a filter argument correctly invokes table.where() and adds filter to metadata.
+        """
 
         _context.args.filter = "column > 10"
 
@@ -143,21 +169,33 @@ class TestRegularExtractor:
         # 2. Metadata check (requires inspecting the save_file call)
         saved_content = save_file_mock.call_args[0][1]
         assert saved_content["metadata"]["filter"] == "column > 10"
+        assert "filter_params" not in saved_content["metadata"]
 
-    def test_regular_extractor_calls_post_extract(self, mocker, _context, save_file_mock, db_table_mock, path_mock):
+    def test_regular_extractor_binds_filter_params(self, _context, save_file_mock, db_table_mock, makedirs_mock):
         """
-        Tests that the _post_extract method is correctly called with processed data.
+        Tests that filter params are bound to the filter and stored in metadata.
         """
 
-        from kamadbm.extractor import RegularExtractor
-        from kdb.table import DatabaseRow
+        _context.args.filter = "column > ? AND name = ?"
+        _context.args.filter_params = ["10", "Alice"]
+
+        extractor = RegularExtractor()
+        extractor.do_extract(_context)
+
+        db_table_mock.where.assert_called_once_with("column > ? AND name = ?", "10", "Alice")
+
+        saved_content = save_file_mock.call_args[0][1]
+        assert saved_content["metadata"]["filter_params"] == ["10", "Alice"]
+
+    def test_regular_extractor_calls_post_extract(self, mocker, _context, save_file_mock, db_table_mock, makedirs_mock,
+                                                  _sample_rows):
+        """
+        Tests that the _post_extract method is correctly called with processed data.
+        """
 
         # Mock _post_extract to change the data structure
         mock_post_extract = mocker.patch.object(RegularExtractor, '_post_extract', return_value=["Modified Data"])
-        db_table_mock.retrieve.return_value = [
-            DatabaseRow("TEST_TABLE", 1, (1, "Alice", None), ["id", "name", "value"]),
-            DatabaseRow("TEST_TABLE", 1, (2, "Bob", 42), ["id", "name", "value"]),
-        ]
+        db_table_mock.retrieve.return_value = _sample_rows
 
         extractor = RegularExtractor()
         extractor.do_extract(_context)
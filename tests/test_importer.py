@@ -1,10 +1,27 @@
+from types import SimpleNamespace
 from unittest.mock import call
 from pytest_mock import MockerFixture
 import pytest
 
+from kamadbm.command import CommandContext
+from kamadbm.importer import ImportCommand, RegularImporter
+
 from command import BaseCommandTest
 
 
+class MockCustomImporter(RegularImporter):
+    """
+    A mock custom importer used for testing dynamic loading.
+    """
+
+    def do_import(self, args):
+        self.imported_data = True
+
+    def __init__(self):
+        super().__init__()
+        self.imported_data = False
+
+
 class TestImportCommand(BaseCommandTest):
     """
     Groups all unit tests for the ImportCommand class.
@@ -12,9 +29,15 @@ class TestImportCommand(BaseCommandTest):
 
     @pytest.fixture
     def _command(self, _cli):
-        from kamadbm.importer import ImportCommand
         return ImportCommand(_cli)
 
+    @pytest.fixture
+    def _version_table_mock(self, _context):
+        """
+        Table returned for import_data_version queries.
+        """
+        return _context.database.table.return_value
+
     def test_execute_direct_file_path(self, read_file_mock, _command, _context):
         """
         Verifies that providing file_path bypasses definition file logic.
@@ -31,12 +54,17 @@ class TestImportCommand(BaseCommandTest):
         importer_mock.do_import.assert_called_once()
         assert call(_context.args.definition_file) not in read_file_mock.call_args_list
 
+        # Parsed file is passed to the importer along with its path
+        assert _context.args.import_file == {"metadata": {"type": "json_type"}}
+        assert _context.args.import_file_path == "/data/single_file.json"
+
     @pytest.mark.parametrize("checksum_match, expected_import_count", [
         (True, 0),  # Checksum same: Skip
         (False, 1)  # Checksum different: Import
     ])
     def test_execute_definition_file_logic(self, checksum_match, expected_import_count, _context, _command,
-                                           read_file_mock, file_checksum_mock, module_patch, mocker: MockerFixture):
+                                           read_file_mock, file_checksum_mock, module_patch, mocker: MockerFixture,
+                                           _version_table_mock):
         """
         Tests the logic for skipping or importing files based on checksums.
         """
@@ -59,7 +87,7 @@ class TestImportCommand(BaseCommandTest):
         # Mock DB metadata record
         mock_metadata = mocker.MagicMock(is_empty=True)
         mock_metadata.get_first.return_value = current_hash
-        _context.database.table().where().retrieve.return_value = mock_metadata
+        _version_table_mock.where.return_value.retrieve.return_value = mock_metadata
 
         importer_mock = _context.cli.get_importer.return_value
 
@@ -68,6 +96,9 @@ class TestImportCommand(BaseCommandTest):
         mock_metadata.add.assert_called()
         assert importer_mock.do_import.call_count == expected_import_count
 
+        # Checksum is only persisted when it has changed
+        assert mock_metadata.save.call_count == expected_import_count
+
     def test_handle_empty_lines_and_comments(self, _context, _command, read_file_mock):
         """
         Verifies the parser skips comments and empty lines in the definition file.
@@ -86,25 +117,29 @@ class TestImportCommand(BaseCommandTest):
         # Check that database wasn't even queried because no valid files were found
         _context.database.table.assert_not_called()
 
+    def test_definition_file_separators_are_normalized(self, _context, _command, read_file_mock, file_checksum_mock,
+                                                       module_patch, _version_table_mock):
+        """
+        Verifies that '/' separators and CRLF line endings in the definition file are handled.
+        """
 
-class TestRegularImporter:
+        if hasattr(_context.args, "file_path"):
+            delattr(_context.args, "file_path")
 
-    @pytest.fixture
-    def _custom_importer_mock(self):
-        from kamadbm.importer import RegularImporter
+        _context.args.definition_file = "manifest.txt"
+        module_patch("os.path.sep", "\\")
 
-        class MockCustomImporter(RegularImporter):
-            """
-            A mock custom importer used for testing dynamic loading.
-            """
+        read_file_mock.side_effect = ["data/users.json\r\n", {"metadata": {"type": "type_a"}}]
+
+        _command._execute_command(_context)
 
-            def do_import(self, args):
-                self.imported_data = True
+        _version_table_mock.where.assert_called_with("file_name = ?", "data\\users.json")
 
-            def __init__(self):
-                super().__init__()
-                self.imported_data = False
 
+class TestRegularImporter:
+
+    @pytest.fixture
+    def _custom_importer_mock(self):
         return MockCustomImporter
 
     @pytest.fixture
@@ -112,15 +147,12 @@ class TestRegularImporter:
         return mocker.MagicMock()
 
     @pytest.fixture
-    def _context(self, mocker: MockerFixture, db_manager_mock, _cli):
+    def _context(self, db_manager_mock, _cli):
         """
         Fixture to provide a mock argparse Namespace object.
         """
 
-        from kamadbm.command import CommandContext
-
-        args = mocker.MagicMock()
-        args.file_path = "/path/to/file"
+        args = SimpleNamespace(file_path="/path/to/file", import_file=None, import_file_path=None)
 
         return CommandContext(
             args=args,
@@ -131,8 +163,6 @@ class TestRegularImporter:
     @pytest.fixture
     def _custom_importers(self, get_members_mock, _custom_importer_mock):
 
-        from kamadbm.importer import RegularImporter
-
         importers = [
             ("RegularImporter", RegularImporter),
             ("CustomImporter", _custom_importer_mock)
@@ -146,8 +176,6 @@ class TestRegularImporter:
         Tests the critical exit path when file_name is missing.
         """
 
-        from kamadbm.importer import RegularImporter
-
         _context.args.file_path = None
 
         importer = RegularImporter()
@@ -164,8 +192,6 @@ class TestRegularImporter:
         Tests the successful data import, checking for remove_all and add_row/set.
         """
 
-        from kamadbm.importer import RegularImporter
-
         import_data = [
             {"id": 1, "name": "A"},
             {"id": 2, "name": "B"}
@@ -205,8 +231,6 @@ class TestRegularImporter:
         Tests that a filter is applied to the table object before remove_all.
         """
 
-        from kamadbm.importer import RegularImporter
-
         # Mock the input file with a filter
         read_file_mock.return_value = {
             "metadata": {"type": "Regular", "table_name": "users", "filter": "is_active = 0"},
@@ -223,13 +247,70 @@ class TestRegularImporter:
         db_table_mock.retrieve.assert_called_once()
         db_table_mock.remove_all.assert_called_once()
 
+    def test_regular_importer_binds_filter_params(self, _context, read_file_mock, db_table_mock):
+        """
+        Tests that filter params from metadata are bound to the filter.
+        """
+
+        read_file_mock.return_value = {
+            "metadata": {
+                "type": "Regular",
+                "table_name": "users",
+                "filter": "is_active = ?",
+                "filter_params": ["0"]
+            },
+            "data": [{"id": 1, "name": "A"}]
+        }
+
+        importer = RegularImporter()
+        importer.do_import(_context)
+
+        db_table_mock.where.assert_called_once_with("is_active = ?", "0")
+
+    def test_regular_importer_uses_parsed_import_file(self, _context, read_file_mock, db_table_mock):
+        """
+        Tests that an already parsed import file isn't read again.
+        """
+
+        _context.args.import_file = {
+            "metadata": {"type": "Regular", "table_name": "users"},
+            "data": [{"id": 1, "name": "A"}]
+        }
+        _context.args.import_file_path = _context.args.file_path
+
+        importer = RegularImporter()
+        importer.do_import(_context)
+
+        read_file_mock.assert_not_called()
+        db_table_mock.add.assert_called_once_with(id=1, name="A")
+
+    def test_regular_importer_ignores_import_file_of_other_path(self, _context, read_file_mock, db_table_mock):
+        """
+        Tests that a parsed import file left over from another path isn't reused.
+        """
+
+        _context.args.import_file = {
+            "metadata": {"type": "Regular", "table_name": "users"},
+            "data": [{"id": 1, "name": "A"}]
+        }
+        _context.args.import_file_path = "/path/to/previous_file"
+
+        read_file_mock.return_value = {
+            "metadata": {"type": "Regular", "table_name": "roles"},
+            "data": [{"id": 2, "name": "B"}]
+        }
+
+        importer = RegularImporter()
+        importer.do_import(_context)
+
+        read_file_mock.assert_called_once_with("/path/to/file", as_json=True)
+        db_table_mock.add.assert_called_once_with(id=2, name="B")
+
     def test_regular_importer_calls_format_data(self, mocker: MockerFixture, _context, read_file_mock, db_table_mock):
         """
         Tests that _format_data is called correctly.
         """
 
-        from kamadbm.importer import RegularImporter
-
         raw_data = [{"id": 1, "name": "A"}]
         formatted_data = [{"id": 1, "name": "A", "status": "processed"}]
 
@@ -1,7 +1,14 @@
+import contextlib
 import datetime
+import os
+from types import SimpleNamespace
+
 import pytest
 
 from pytest_mock import MockerFixture
+
+from kamadbm.migrator import MigrateCommand
+
 from command import BaseCommandTest
 
 
@@ -9,7 +16,6 @@ class TestMigrateCommand(BaseCommandTest):
 
     @pytest.fixture
     def _command(self, _cli):
-        from kamadbm.migrator import MigrateCommand
         return MigrateCommand(_cli)
 
     @pytest.fixture
@@ -27,13 +33,56 @@ class TestMigrateCommand(BaseCommandTest):
         return cli
 
     @pytest.fixture
-    def migration_exists_mock(self, mocker):
-        from kamadbm.migrator import MigrateCommand
-        return mocker.patch.object(MigrateCommand, '_MigrateCommand__migration_exists')
+    def scanned_directories(self):
+        """
+        Directories os.scandir has been called with, in call order.
+        """
+        return []
+
+    @pytest.fixture
+    def fake_scandir(self, module_patch, scanned_directories):
+        """
+        Patches os.scandir to list file names registered per directory.
+        """
+
+        directories: dict[str, list[str]] = {}
+
+        def scandir(directory):
+            scanned_directories.append(directory)
+            return contextlib.nullcontext([
+                SimpleNamespace(name=file_name, path=f"{directory}/{file_name}", is_file=lambda: True)
+                for file_name in directories[directory]
+            ])
+
+        module_patch("os.scandir", side_effect=scandir)
+        return directories
+
+    @pytest.fixture
+    def frozen_now(self, module_patch):
+        """
+        Freezes datetime.now() used to stamp applied migrations.
+        """
+
+        datetime_mock = module_patch("datetime.datetime")
+        datetime_mock.now.return_value = datetime.datetime(2026, 1, 22)
+
+        return datetime_mock.now.return_value
+
+    @pytest.fixture
+    def strip_extension_mock(self, remove_extension_from_path_mock):
+        """
+        Makes remove_extension_from_path strip the file extension.
+        """
+
+        remove_extension_from_path_mock.side_effect = lambda path: os.path.splitext(path)[0]
+        return remove_extension_from_path_mock
+
+    @pytest.fixture
+    def applied_migrations_mock(self, mocker):
+        return mocker.patch.object(MigrateCommand, '_MigrateCommand__get_applied_migrations')
 
     @pytest.fixture
     def update_schema_mock(self, mocker):
-        from kamadbm.migrator import MigrateCommand
         return mocker.patch.object(MigrateCommand, '_MigrateCommand__update_schema_version')
 
     def test_execute_command_flow(self, mocker: MockerFixture, _command, _context):
@@ -41,8 +90,6 @@ class TestMigrateCommand(BaseCommandTest):
         Tests that the main entry point calls initialize and migrate.
         """
 
-        from kamadbm.migrator import MigrateCommand
-
         mock_init = mocker.patch.object(MigrateCommand, '_MigrateCommand__initialize')
         mock_migrate = mocker.patch.object(MigrateCommand, '_MigrateCommand__migrate')
 
@@ -56,133 +103,157 @@ class TestMigrateCommand(BaseCommandTest):
         Verifies that both tracking tables are initialized.
         """
 
-        from kamadbm.migrator import MigrateCommand
-
         # Accessing private static method
         MigrateCommand._MigrateCommand__initialize(_context)  # noqa
 
-        calls = [_call[0][0] for _call in _context.database.execute.call_args_list]
+        schema_version_sql, import_data_version_sql = (
+            _call.args[0] for _call in _context.database.execute.call_args_list
+        )
 
-        assert any("CREATE TABLE IF NOT EXISTS schema_version" in sql for sql in calls)
-        assert any("CREATE TABLE IF NOT EXISTS import_data_version" in sql for sql in calls)
+        assert "CREATE TABLE IF NOT EXISTS schema_version" in schema_version_sql
+        assert "CREATE TABLE IF NOT EXISTS import_data_version" in import_data_version_sql
 
-    @pytest.mark.parametrize("has_record, expected", [
-        (True, True),
-        (False, False)
-    ])
-    def test_migration_exists(self, _context, has_record, expected):
+    def test_get_applied_migrations(self, _context):
         """
-        Tests the database check for existing migration records.
+        Tests that applied migrations are retrieved with a single query.
         """
 
-        from kamadbm.migrator import MigrateCommand
-
-        _context.database.select().fetchone.return_value = (1,) if has_record else None
+        _context.database.select().fetchall.return_value = [("v1",), ("v2",)]
         _context.database.select.reset_mock()
 
-        result = MigrateCommand._MigrateCommand__migration_exists(_context.database, "v1.sql")  # noqa
-
-        assert result is expected
-        _context.database.select.assert_called_once_with(
-            "SELECT 1 FROM schema_version WHERE file_name = ?", ("v1.sql",)
-        )
-
-    def test_update_schema_version_fluent_api(self, _context, module_patch, db_table_mock, remove_extension_from_path_mock):
+        result = MigrateCommand._MigrateCommand__get_applied_migrations(_context.database)  # noqa
+
+        assert result == {"v1", "v2"}
+        _context.database.select.assert_called_once_with("SELECT file_name FROM schema_version")
+
+    @pytest.mark.parametrize("migration_stem, expected_row", [
+        (
+            "v2025_10_12_2205__Create_tables",
+            {
+                "file_name": "v2025_10_12_2205__Create_tables",
+                "version": "2025.10.12.2205",
+                "description": "Create tables"
+            }
+        ),
+        # Name is missing the double underscore separator.
+        ("v2026_01_22_invalid_format", None)
+    ])
+    def test_update_schema_version(self, _context, db_table_mock, remove_extension_from_path_mock,
+                                   migration_stem, expected_row):
         """
-        Tests the new fluent table API for updating schema versions.
+        Tests that __update_schema_version adds a parsed schema_version row,
+        or raises RuntimeError when the migration filename format is invalid.
         """
 
-        from kamadbm.migrator import MigrateCommand
+        date_applied = "2026-01-22 00:00:00"
 
-        # Mock datetime to ensure consistency
-        mock_now = datetime.datetime(2026, 1, 22)
-        module_patch("datetime.datetime").now.return_value = mock_now
+        # The method calls remove_extension_from_path before validation.
+        remove_extension_from_path_mock.return_value = migration_stem
 
-        migration_name = "v2025_10_12_2205__Create_tables.sql"
+        def update_schema_version():
+            MigrateCommand._MigrateCommand__update_schema_version(  # noqa
+                _context.database,
+                f"{migration_stem}.sql",
+                date_applied
+            )
 
-        # The method now calls remove_extension_from_path internally
-        remove_extension_from_path_mock.return_value = "v2025_10_12_2205__Create_tables"
-        MigrateCommand._MigrateCommand__update_schema_version(_context.database, migration_name)  # noqa
+        if expected_row is None:
+            with pytest.raises(RuntimeError) as error:
+                update_schema_version()
+
+            assert f"Migration {migration_stem} is invalid." in str(error.value)
+
+            # Ensure the database was never touched after the error
+            _context.database.retrieve_table.assert_not_called()
+            return
+
+        update_schema_version()
 
         _context.database.retrieve_table.assert_called_with("schema_version")
         db_table_mock.add.assert_called_once_with(
-            file_name="v2025_10_12_2205__Create_tables",
-            version="2025.10.12.2205",
-            description="Create tables",
-            date_applied=mock_now,
+            **expected_row,
+            date_applied=date_applied,
             success=1
         )
 
-    def test_migrate_skips_all_if_latest_exists(self, _context, migration_exists_mock, module_patch):
+    def test_migrate_skips_all_if_latest_exists(self, _context, applied_migrations_mock, update_schema_mock,
+                                                fake_scandir, scanned_directories, strip_extension_mock):
         """
         If the last migration in the list exists, the whole process should exit.
         """
 
-        from kamadbm.migrator import MigrateCommand
+        fake_scandir.update({
+            "/extra/migrations": ["x_last.sql"],
+            "/base/migrations": ["a_first.sql", "notes.txt"]
+        })
 
-        # Dir 1 and Dir 2
-        module_patch("os.listdir", side_effect=[["x_last.sql"], ["a_first.sql"]])
-        migration_exists_mock.return_value = True
+        # Only the last one (sorted alphabetically: x_last.sql) has been applied
+        applied_migrations_mock.return_value = {"x_last"}
 
         MigrateCommand._MigrateCommand__migrate(_context)  # noqa
 
-        # Should have checked the last one (sorted alphabetically: x_last.sql)
-        migration_exists_mock.assert_called_once()
-        assert "x_last.sql" in migration_exists_mock.call_args[0][1]
+        # Each migration directory is scanned exactly once
+        assert scanned_directories == ["/extra/migrations", "/base/migrations"]
+        applied_migrations_mock.assert_called_once_with(_context.database)
 
         # Database script should NOT have run
         _context.database.connection().executescript.assert_not_called()
+        update_schema_mock.assert_not_called()
 
-    def test_migrate_applies_only_missing_files(self, _context, migration_exists_mock, update_schema_mock,
-                                                module_patch, read_file_mock):
+    def test_migrate_applies_only_missing_files(self, _context, applied_migrations_mock, update_schema_mock,
+                                                fake_scandir, read_file_mock, frozen_now, strip_extension_mock):
         """
         Tests the full loop: discovering files across dirs and applying missing ones.
         """
 
-        from kamadbm.migrator import MigrateCommand
-
         _context.args.migration_directories = ["/dir1"]
         _context.cli.extra_migration_paths = ["/dir2"]
 
         # One file per dir
-        module_patch("os.listdir", side_effect=[["v1.sql"], ["v2.sql"]])
+        fake_scandir.update({"/dir1": ["v2.sql"], "/dir2": ["v1.sql"]})
         read_file_mock.return_value = "SELECT 1;"
 
-        # Scenario: v2 exists, but v1 is missing.
+        # Scenario: v1 exists, but v2 is missing.
         # (Note: Logic checks latest first. If v2 exists, it returns.
         # To test the loop, latest must NOT exist.)
-        migration_exists_mock.side_effect = [
-            False,  # Check latest (v2.sql) -> No
-            True,  # Loop check v1.sql -> Yes (skip)
-            False  # Loop check v2.sql -> No (apply)
-        ]
+        applied_migrations_mock.return_value = {"v1"}
 
         MigrateCommand._MigrateCommand__migrate(_context)  # noqa
 
         # Verify executescript was only called for v2
         _context.database.connection().executescript.assert_called_once_with("SELECT 1;")
-        update_schema_mock.assert_called_once_with(_context.database, "v2.sql")
+        read_file_mock.assert_called_once_with("/dir1/v2.sql")
+        update_schema_mock.assert_called_once_with(_context.database, "v2.sql", frozen_now.isoformat(" "))
 
-    def test_update_schema_version_raises_on_invalid_name(self, _context, remove_extension_from_path_mock):
+    def test_migrate_skips_migrations_recorded_by_previous_run(self, _context, applied_migrations_mock,
+                                                               fake_scandir, read_file_mock, db_table_mock,
+                                                               strip_extension_mock):
         """
-        Tests that __update_schema_version raises RuntimeError when
-        the migration filename format is invalid (missing '__').
+        Tests that migrations recorded in schema_version by a previous run
+        are recognized as applied on the next run.
         """
 
-        from kamadbm.migrator import MigrateCommand
+        _context.args.migration_directories = ["/dir1"]
+        _context.cli.extra_migration_paths = ["/dir2"]
 
-        # This name is missing the double underscore separator
-        invalid_name = "v2026_01_22_invalid_format.sql"
+        fake_scandir.update({
+            "/dir1": ["v2025_10_13_1000__Add_index.sql"],
+            "/dir2": ["v2025_10_12_2205__Create_tables.sql"]
+        })
+        read_file_mock.return_value = "SELECT 1;"
+        applied_migrations_mock.return_value = set()
 
-        # We must mock remove_extension_from_path because it's called
-        # before the validation check.
-        remove_extension_from_path_mock.return_value = "v2026_01_22_invalid_format"
+        MigrateCommand._MigrateCommand__migrate(_context)  # noqa
 
-        with pytest.raises(RuntimeError) as error:
-            MigrateCommand._MigrateCommand__update_schema_version(_context.database, invalid_name)  # noqa
+        # Names exactly as __update_schema_version wrote them.
+        recorded_migrations = {_call.kwargs["file_name"] for _call in db_table_mock.add.call_args_list}
+        assert recorded_migrations == {"v2025_10_12_2205__Create_tables", "v2025_10_13_1000__Add_index"}
 
-        # Verify the error message matches the implementation
-        assert "Migration v2026_01_22_invalid_format is invalid." in str(error.value)
+        _context.database.connection().executescript.reset_mock()
+        db_table_mock.add.reset_mock()
+        applied_migrations_mock.return_value = recorded_migrations
 
-        # Ensure the database was never touched after the error
-        _context.database.retrieve_table.assert_not_called()
\ No newline at end of file
+        MigrateCommand._MigrateCommand__migrate(_context)  # noqa
+
+        _context.database.connection().executescript.assert_not_called()
+        db_table_mock.add.assert_not_called()